@@ -2,6 +2,7 @@ import json
 import netrc
 import os
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -125,9 +126,14 @@ def main():
     final_directory = prepare_for_delivery(nc_path, loc_data)
 
     if args.bucket:
-        for file in final_directory.glob('S1-GUNW*'):
+        def upload_one(file):
             aws.upload_file_to_s3(file, args.bucket, args.bucket_prefix)
 
+        # The product, browse and metadata uploads are independent
+        files = list(final_directory.glob('S1-GUNW*'))
+        with ThreadPoolExecutor(max_workers=max(len(files), 1)) as executor:
+            list(executor.map(upload_one, files))
+
 
 if __name__ == '__main__':
     main()
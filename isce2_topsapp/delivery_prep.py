@@ -5,7 +5,6 @@ from pathlib import Path
 import numpy as np
 import rasterio
 from PIL import Image
-from matplotlib import cm
 
 from isce2_topsapp.packaging import DATASET_VERSION
 from isce2_topsapp.water_mask import get_water_mask_raster
@@ -41,7 +40,9 @@ def scale_img(img: np.ndarray,
     if i_min == i_max:
         # then image is constant image and clip between new_min and new_max
         return np.clip(img, new_min, new_max)
-    img_scaled = (img - i_min) / (i_max - i_min) * (new_max - new_min)
+    # true division yields a new float array; rescale it in place from there
+    img_scaled = (img - i_min) / (i_max - i_min)
+    img_scaled *= (new_max - new_min)
     img_scaled += new_min
     return img_scaled
 
@@ -70,6 +71,9 @@ def save_png(arr: np.ndarray,
              out_png_path: Path,
              scale_dimension: float = .2,
              cmap: str = 'hsv') -> Path:
+    # matplotlib is slow to import and only needed for the browse image
+    from matplotlib import cm
+
     shape = arr.shape
     # from normal dynamic range to [0, 1]
     arr_scaled = scale_img(arr)
@@ -80,7 +84,8 @@ def save_png(arr: np.ndarray,
 
     # https://stackoverflow.com/a/10967471
     cmap_trans = cm.__dict__[cmap]
-    im = Image.fromarray(np.uint8(cmap_trans(arr_scaled) * 255))
+    # bytes=True maps directly to uint8 RGBA, skipping a float64 RGBA array
+    im = Image.fromarray(cmap_trans(arr_scaled, bytes=True))
     # https://stackoverflow.com/a/13211834
     im = im.resize(shape_new, Image.ANTIALIAS)
 
@@ -96,12 +101,14 @@ def get_wrapped_ifg(nc_path: Path) -> np.ndarray:
     mask_water = get_water_mask_raster(profile)
     mask = mask_cc | mask_water
 
-    wrapped = np.zeros(mask.shape)
     # If no valid data skip
-    if np.sum(~mask) > 0:
-        unw_m = unw.copy()
-        unw_m[mask] = np.nan
-        wrapped = np.angle(np.exp(1j * unw_m))
+    if mask.all():
+        return np.zeros(mask.shape)
+
+    # unw is read just above and not shared, so it can be masked in place
+    unw[mask] = np.nan
+    # equivalent to np.angle(np.exp(1j * unw)) without complex temporaries
+    wrapped = np.arctan2(np.sin(unw), np.cos(unw))
     return wrapped
 
 
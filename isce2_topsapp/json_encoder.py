@@ -7,9 +7,15 @@ from shapely.geometry import Polygon
 # Source: https://docs.python.org/3/library/json.html
 # and: https://stackoverflow.com/a/3768975
 class MetadataEncoder(json.JSONEncoder):
+    _DISPATCH = {PosixPath: str,
+                 Polygon: lambda obj: obj.__geo_interface__}
+
     def default(self, obj):
-        if isinstance(obj, PosixPath):
-            return str(obj)
-        if isinstance(obj, Polygon):
-            return obj.__geo_interface__
+        encode = self._DISPATCH.get(type(obj))
+        if encode is not None:
+            return encode(obj)
+        # Fall back to isinstance so subclasses are still handled
+        for obj_type, encode in self._DISPATCH.items():
+            if isinstance(obj, obj_type):
+                return encode(obj)
         return json.JSONEncoder.default(self, obj)
@@ -1,4 +1,5 @@
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
@@ -7,6 +8,9 @@ import requests
 S1A_AUX_URL = 'https://sar-mpc.eu/download/55282da1-679d-4ecf-aeef-d06b024451cf'
 S1B_AUX_URL = 'https://sar-mpc.eu/download/3c8b7c8d-d3de-4381-a19d-7611fb8734b9'
 
+# Reused across downloads so both archives share keep-alive connections
+AUX_CAL_SESSION = requests.Session()
+
 
 def download_aux_cal(aux_cal_dir: Union[str, Path] = None):
     aux_cal_dir = aux_cal_dir or 'aux_cal'
@@ -14,20 +18,26 @@ def download_aux_cal(aux_cal_dir: Union[str, Path] = None):
     aux_cal_dir.mkdir(exist_ok=True, parents=True)
 
     def download_one(url):
-        resp = requests.get(url)
         file_name = url.split('/')[-1]
         out_path = aux_cal_dir/file_name
 
-        with open(out_path, 'wb') as file:
-            file.write(resp.content)
+        # Stream to disk so the archive is never held in memory
+        with AUX_CAL_SESSION.get(url, stream=True) as resp:
+            resp.raise_for_status()
+            with open(out_path, 'wb') as file:
+                for chunk in resp.iter_content(chunk_size=2**20):
+                    file.write(chunk)
         return out_path
 
-    s1a_path = download_one(S1A_AUX_URL)
-    s1b_path = download_one(S1B_AUX_URL)
+    # The downloads are independent and network bound
+    urls = [S1A_AUX_URL, S1B_AUX_URL]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        zip_paths = list(executor.map(download_one, urls))
 
-    with zipfile.ZipFile(s1a_path) as zip_file:
-        zip_file.extractall(aux_cal_dir)
-    with zipfile.ZipFile(s1b_path) as zip_file:
-        zip_file.extractall(aux_cal_dir)
+    for zip_path in zip_paths:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            zip_file.extractall(aux_cal_dir)
+        # Only the extracted SAFE directories are read by topsApp
+        zip_path.unlink()
 
     return {'aux_cal_dir': str(aux_cal_dir)}
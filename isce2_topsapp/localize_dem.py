@@ -33,8 +33,7 @@ def fix_image_xml(isce_raster_path: str) -> str:
                '-i',
                str(isce_raster_path),
                '--full']
-    fix_cmd_line = ' '.join(fix_cmd)
-    subprocess.check_call(fix_cmd_line, shell=True)
+    subprocess.check_call(fix_cmd)
     return isce_raster_path
 
 
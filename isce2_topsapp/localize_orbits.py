@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -27,15 +28,18 @@ def download_orbits(reference_scenes: list,
 
     orbit_fetcher = _spoof_orbit_download if dry_run else get_orb.downloadSentinelOrbitFile
 
-    reference_orbits = []
-    for scene in reference_scenes:
-        orbit_file, _ = orbit_fetcher(scene, str(orbit_dir))
-        reference_orbits.append(orbit_file)
-
-    secondary_orbits = []
-    for scene in secondary_scenes:
-        orbit_file, _ = orbit_fetcher(scene, str(orbit_dir))
-        secondary_orbits.append(orbit_file)
+    def fetch_orbits(scenes):
+        orbit_files = []
+        for scene in scenes:
+            orbit_file, _ = orbit_fetcher(scene, str(orbit_dir))
+            orbit_files.append(orbit_file)
+        return orbit_files
+
+    # Reference and secondary dates are a repeat cycle apart so they never share
+    # an orbit file; scenes from the same date may, so each list stays serial
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reference_orbits, secondary_orbits = executor.map(fetch_orbits,
+                                                          [reference_scenes, secondary_scenes])
 
     return {
         'orbit_directory': orbit_directory,
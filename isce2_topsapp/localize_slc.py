@@ -52,8 +52,10 @@ def download_slcs(reference_ids: list,
                   secondary_ids: list,
                   max_workers: int = 5,
                   dry_run: bool = False) -> dict:
-    reference_obs = get_asf_slc_objects(reference_ids)
-    secondary_obs = get_asf_slc_objects(secondary_ids)
+    # A single search for both dates saves a round trip to the ASF API
+    slc_obs = get_asf_slc_objects(list(reference_ids) + list(secondary_ids))
+    reference_obs = [ob for ob in slc_obs if ob.properties['sceneName'] in reference_ids]
+    secondary_obs = [ob for ob in slc_obs if ob.properties['sceneName'] in secondary_ids]
 
     # store properties so we don't have to retreive them again
     reference_props = [ob.properties for ob in reference_obs]
@@ -65,8 +67,10 @@ def download_slcs(reference_ids: list,
 
     intersection_geo = check_geometry(reference_obs, secondary_obs)
 
+    # One authenticated session shares its connection pool across downloads
+    session = get_session()
+
     def download_one(resp):
-        session = get_session()
         file_name = resp.properties['fileName']
         if not dry_run:
             resp.download(path='.', session=session)
@@ -142,8 +142,8 @@ def make_geocube(isce_data_directory: Union[str, Path]) -> Path:
     merged_dir = Path(isce_data_directory)/'merged'
     os.chdir(merged_dir)
 
-    cmd = 'makeGeocube --r ../reference --s ../secondary -o metadata.h5'
-    subprocess.check_call(cmd, shell=True)
+    cmd = ['makeGeocube', '--r', '../reference', '--s', '../secondary', '-o', 'metadata.h5']
+    subprocess.check_call(cmd)
     os.chdir(cwd)
 
     metadata_path = merged_dir/'metadata.h5'
@@ -200,8 +200,8 @@ def perform_netcdf_packaging(*,
     cwd = Path.cwd()
     os.chdir(merged_dir)
 
-    cmd = 'nc_packaging'
-    subprocess.check_call(cmd, shell=True)
+    cmd = ['nc_packaging']
+    subprocess.check_call(cmd)
     os.chdir(cwd)
 
     out_nc_file = merged_dir/f'{gunw_id}.nc'
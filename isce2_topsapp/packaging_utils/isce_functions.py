@@ -5,6 +5,7 @@
 from __future__ import division
 from builtins import str
 from builtins import range
+from functools import lru_cache
 from osgeo import gdal, ogr, osr
 
 
@@ -54,7 +55,7 @@ def data_loading(filename,out_data_type=None,data_band=None):
     # change the dataype if provided
     if out_data_type is not None:
         # changing the format if needed
-        out_data = out_data.astype(dtype=out_data_type)
+        out_data = out_data.astype(dtype=out_data_type, copy=False)
 
     return out_data, geoTrans,projectionRef, NoData
 
@@ -114,24 +115,18 @@ def get_geocoded_coords_ISCE2(args):
     rows = ds.RasterYSize
 
     # getting the gdal transform and projection
-    geoTrans = str(ds.GetGeoTransform())
+    geoTrans = str(gt)
     projectionRef = str(ds.GetProjection())
 
     count=0
     for geovariable in geovariables:
         variable = geovariable[0]
         if variable == 'longitude' or variable == 'Longitude' or variable == 'lon' or variable == 'Lon':
-            lon_arr = list(range(0, cols))
-            lons = np.empty((cols,),dtype='float64')
-            for px in lon_arr:
-                lons[px] = gt[0] + (px * gt[1])
+            lons = gt[0] + (np.arange(cols, dtype='float64') * gt[1])
             count+=1
             lons_map = geovariable[1]
         elif variable == 'latitude' or variable == 'Latitude' or variable == 'lat' or variable == 'Lat':
-            lat_arr = list(range(0, rows))
-            lats = np.empty((rows,),dtype='float64')
-            for py in lat_arr:
-                lats[py] = gt[3] + (py * gt[5])
+            lats = gt[3] + (np.arange(rows, dtype='float64') * gt[5])
             count+=1
             lats_map = geovariable[1]
         else:
@@ -169,24 +164,18 @@ def get_geocoded_coords(args):
     rows = ds.RasterYSize
 
     # getting the gdal transform and projection
-    geoTrans = str(ds.GetGeoTransform())
+    geoTrans = str(gt)
     projectionRef = str(ds.GetProjection())
 
     count=0
     for geovariable in geovariables:
         variable = geovariable[0]
         if variable == 'longitude' or variable == 'Longitude' or variable == 'lon' or variable == 'Lon':
-            lon_arr = list(range(0, cols))
-            lons = np.empty((cols,),dtype='float64')
-            for px in lon_arr:
-                lons[px] = gt[0] + (gt[1] / 2) + (px * gt[1])
+            lons = gt[0] + (gt[1] / 2) + (np.arange(cols, dtype='float64') * gt[1])
             count+=1
             lons_map = geovariable[1]
         elif variable == 'latitude' or variable == 'Latitude' or variable == 'lat' or variable == 'Lat':
-            lat_arr = list(range(0, rows))
-            lats = np.empty((rows,),dtype='float64')
-            for py in lat_arr:
-                lats[py] = gt[3] - (gt[5] / 2) + (py * gt[5])
+            lats = gt[3] - (gt[5] / 2) + (np.arange(rows, dtype='float64') * gt[5])
             count+=1
             lats_map = geovariable[1]
         else:
@@ -205,9 +194,11 @@ def get_geocoded_coords(args):
     coordinate_dict['data_transf'] = geoTrans
     return coordinate_dict
 
+@lru_cache(maxsize=None)
 def get_topsApp_data(topsapp_xml='topsApp'):
     '''
         loading the topsapp xml file
+        cached as the packaging queries the same topsapp xml for several variables
     '''
 
     import isce
@@ -393,7 +384,12 @@ def get_tops_metadata_variable(args):
 
     return data
 
+@lru_cache(maxsize=None)
 def get_tops_metadata(masterdir):
+    '''
+        cached as the packaging queries the same directory for several variables
+        and loading the IW*.xml products is expensive
+    '''
     import pdb
     from scipy.constants import c
 
@@ -401,6 +401,12 @@ class Cube(object):
         tarproj_trans = pyproj.Transformer.from_proj(self.inps.proj, self.inps.lla, always_xy=True)
         targxyz_trans = pyproj.Transformer.from_proj(self.inps.proj, self.inps.ecef, always_xy=True)
         targutm_trans = pyproj.Transformer.from_proj(self.inps.proj, self.inps.utmproj, always_xy=True)
+        satllh_trans = pyproj.Transformer.from_proj(self.inps.ecef,
+                                                    self.inps.lla,
+                                                    always_xy=True)
+        satutm_trans = pyproj.Transformer.from_proj(self.inps.lla,
+                                                    self.inps.utmproj,
+                                                    always_xy=True)
 
         for jj in range(self.inps.Nx):
             xval = self.inps.x0 + jj * self.inps.xspacing
@@ -422,13 +428,6 @@ class Cube(object):
 
                 if mrng is not None:
 
-                    satllh_trans = pyproj.Transformer.from_proj(self.inps.ecef,
-                                                                self.inps.lla,
-                                                                always_xy=True)
-                    satutm_trans = pyproj.Transformer.from_proj(self.inps.lla,
-                                                                self.inps.utmproj,
-                                                                always_xy=True)
-
                     sv = self.inps.orbit.interpolateOrbit(
                         mtaz, method='hermite')
                     satpos = np.array(sv.getPosition())
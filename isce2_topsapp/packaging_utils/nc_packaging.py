@@ -157,12 +157,9 @@ def write_dataset(fid,data,properties_data):
         elif isinstance(data, collections.abc.Iterable):
             if isinstance(data[0],str):
                 dset = fid.createVariable(properties_data.name, str, ('matchup',), zlib=True)
-                count = 0
-                for data_line in data:
+                for count, data_line in enumerate(data):
                     dset[count]=data_line
                     logger.info(properties_data.name + " count = " + str(count) + '  ' + data_line)
-
-                    count =+1
             else:
                 logger.info('i am a collection, not yet programmed')
         elif data is None:
@@ -190,27 +187,23 @@ def expand_attrdict(attr_dict, attr_name, attr_value):
     if attr_dict is None:
         attr_dict = {}
 
+    # index of each attribute name in use, the last entry wins for duplicate names
+    if len(attr_dict)==0:
+        attr_dict = []
+    name_index = {attr_dict_item["name"]: count_dict for count_dict, attr_dict_item in enumerate(attr_dict)}
+
     for count in range(len(attr_name)):
         attr_temp = {}
         attr_temp["name"]=attr_name[count]
         attr_temp["value"]=attr_value[count]
 
-        # adding it to the original dictionary
-        if len(attr_dict)==0:
-            attr_dict = [attr_temp]
+        # if a match was found needs to update the attribute information
+        name_match = name_index.get(attr_temp["name"])
+        if name_match is not None:
+            attr_dict[name_match]=attr_temp
         else:
-            # looping over all the attributes to see if the name already is in use
-            count_dict = 0
-            name_match = None
-            for attr_dict_item in attr_dict:
-                if attr_dict_item["name"] == attr_temp["name"]:
-                    name_match = count_dict
-                count_dict = count_dict +1
-            # if a match was found needs to update the attribute information
-            if name_match is not None:
-                attr_dict[name_match]=attr_temp
-            else:
-                attr_dict.append(attr_temp)
+            name_index[attr_temp["name"]] = len(attr_dict)
+            attr_dict.append(attr_temp)
 
     return attr_dict
 
@@ -269,7 +262,7 @@ def create_dataset(fid,dataset,fid_parent=None):
         # change the dataype if provided
         if properties_data.type is not None:
             # changing the format if needed
-            data = data.astype(dtype=properties_data.type)
+            data = data.astype(dtype=properties_data.type, copy=False)
 
     # tracking if its a regular dataset, 2D geocoordinates, or 3D geocoordinates and make the CF compliance for these datasets
     if properties_data.name=="GEOCOOR2" or properties_data.name=="GEOCOOR3":
@@ -365,11 +358,7 @@ def create_dataset(fid,dataset,fid_parent=None):
         # formatting the string as an array of single char
         # fill data with a charakter at each postion of the polyfgon string
         for poly_i in range(n_poly):
-            polygon_i = list(data[poly_i])
-            data_temp = []
-            data_temp = np.empty((len(polygon_i),),'S1')
-            for n in range(len(polygon_i)):
-                data_temp[n] = polygon_i[n]
+            data_temp = np.array(list(data[poly_i]),dtype='S1')
             dset[poly_i] = data_temp
 
         # setting the attribute
@@ -520,7 +509,7 @@ def data_loading(filename,out_data_type=None,data_band=None):
     # change the dataype if provided
     if out_data_type is not None:
         # changing the format if needed
-        out_data = out_data.astype(dtype=out_data_type)
+        out_data = out_data.astype(dtype=out_data_type, copy=False)
 
     return out_data, geoTrans,projectionRef, NoData
 
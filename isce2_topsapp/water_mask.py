@@ -117,4 +117,5 @@ def get_water_mask_raster(profile: dict) -> np.ndarray:
                                   fill_value=1,
                                   dtype='uint8',
                                   all_touched=False)
-    return X.astype(bool)
+    # X only contains 0 and 1 so a bool view avoids copying the raster
+    return X.view(bool)